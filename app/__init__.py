@@ -1,11 +1,20 @@
 from flask import Flask
 from flask_cors import CORS
 from .config import Config
+from .services.cache_service import AnalysisCache
 
 def create_app():
     app = Flask(__name__)
     CORS(app)
     app.config.from_object(Config)
+    app.extensions['analysis_cache'] = AnalysisCache(
+        app.config['ANALYSIS_CACHE_TTL'],
+        max_entries=app.config['ANALYSIS_CACHE_MAX_ENTRIES']
+    )
+    app.extensions['html_cache'] = AnalysisCache(
+        app.config['ANALYSIS_CACHE_TTL'],
+        max_entries=app.config['HTML_CACHE_MAX_ENTRIES']
+    )
 
     from .routes import main
     app.register_blueprint(main)
@@ -1,5 +1,6 @@
 import os
 import logging
+import multiprocessing
 from dotenv import load_dotenv
 
 # Configure logging
@@ -21,3 +22,28 @@ class Config:
     LLM_API_URL = 'http://0.0.0.0:4000'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     LOG_LEVEL = 'INFO'
+    # Validate GitHub listings with pydantic (slower, useful for debugging)
+    GITHUB_VALIDATE_CONTENTS = os.getenv('GITHUB_VALIDATE_CONTENTS', '').lower() in ('1', 'true', 'yes')
+
+    # Multi-language analysis
+    ANALYSIS_MAX_WORKERS = int(os.getenv('ANALYSIS_MAX_WORKERS', '4'))
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', '3600'))  # Seconds
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', '256'))
+    HTML_CACHE_MAX_ENTRIES = int(os.getenv('HTML_CACHE_MAX_ENTRIES', '256'))
+
+    # /api/analyze HTTP caching and compression
+    ANALYZE_CACHE_MAX_AGE = int(os.getenv('ANALYZE_CACHE_MAX_AGE', '300'))  # Seconds
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '500'))  # Bytes
+
+    # Production server (gunicorn.conf.py); the worker class is read there
+    # from SERVER_WORKER_CLASS so gevent can monkey-patch before the app loads
+    SERVER_BIND = os.getenv('SERVER_BIND', '0.0.0.0:5000')
+    SERVER_WORKERS = int(os.getenv('WEB_CONCURRENCY', str(multiprocessing.cpu_count() * 2 + 1)))
+    SERVER_THREADS = int(os.getenv('SERVER_THREADS', '4'))
+    SERVER_KEEPALIVE = int(os.getenv('SERVER_KEEPALIVE', '5'))  # Seconds
+    SERVER_MAX_REQUESTS = int(os.getenv('SERVER_MAX_REQUESTS', '1000'))
+    SERVER_MAX_REQUESTS_JITTER = int(os.getenv('SERVER_MAX_REQUESTS_JITTER', '100'))
+    SERVER_TIMEOUT = int(os.getenv('SERVER_TIMEOUT', '180'))  # LLM calls retry up to 3 times
+    # Drain window on SIGTERM; defaults to SERVER_TIMEOUT so in-flight analyses can finish
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', str(SERVER_TIMEOUT)))
+    READINESS_TIMEOUT = int(os.getenv('READINESS_TIMEOUT', '3'))  # Seconds per upstream check
@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify, request, render_template, current_app, send_file
 from .services.github_service import GitHubService
-from .services.llm_service import LLMService
+from .services.llm_service import LLMService, LANGUAGE_PROMPTS
 import logging
 from markdown2 import markdown
 import json
@@ -20,6 +20,14 @@ from pathlib import Path
 import os
 import io
 import urllib.parse
+import zipfile
+import hashlib
+import gzip
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; fall back to gzip
+    brotli = None
 
 # Register Chinese font
 pdfmetrics.registerFont(UnicodeCIDFont('STSong-Light'))
@@ -182,21 +190,425 @@ def create_pdf_style(language):
     
     return title_style, normal_style, heading_styles, bullet_style, code_style
 
+def build_pdf(analysis, language):
+    """Render markdown analysis into PDF bytes for the given language."""
+    # Create a PDF in memory
+    pdf_buffer = io.BytesIO()
+
+    # Create the PDF document with A4 size and margins
+    doc = SimpleDocTemplate(
+        pdf_buffer,
+        pagesize=letter,
+        rightMargin=54,  # Adjusted margins
+        leftMargin=54,
+        topMargin=54,
+        bottomMargin=54,
+        title=TITLES.get(language, TITLES['en'])  # Add PDF title metadata
+    )
+
+    # Get styles with appropriate font
+    title_style, normal_style, heading_styles, bullet_style, code_style = create_pdf_style(language)
+
+    # Convert markdown to a format ReportLab can handle
+    story = []
+
+    # Add title in the correct language
+    title_text = process_markdown_text(TITLES.get(language, TITLES['en']), title_style)
+    story.append(Paragraph(title_text, title_style))
+    story.append(Spacer(1, 24))  # More space after title
+
+    # Process the content line by line
+    lines = analysis.split('\n')
+    in_code_block = False
+    code_content = []
+    current_paragraph = []
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+
+        # Skip empty lines but add paragraph if we have content
+        if not line:
+            if current_paragraph:
+                text = ' '.join(current_paragraph)
+                text = process_markdown_text(text, normal_style)
+                story.append(Paragraph(text, normal_style))
+                story.append(Spacer(1, 4))
+                current_paragraph = []
+            i += 1
+            continue
+
+        # Handle code blocks
+        if line.startswith('```') or line.endswith('```'):
+            if line.startswith('```'):
+                in_code_block = True
+                code_content = []
+            else:
+                in_code_block = False
+                if code_content:
+                    story.append(Paragraph('\n'.join(code_content), code_style))
+                code_content = []
+            i += 1
+            continue
+
+        if in_code_block:
+            code_content.append(line)
+            i += 1
+            continue
+
+        # Handle headers
+        if line.startswith('#'):
+            # Add any pending paragraph
+            if current_paragraph:
+                text = ' '.join(current_paragraph)
+                text = process_markdown_text(text, normal_style)
+                story.append(Paragraph(text, normal_style))
+                current_paragraph = []
+
+            level = len(line.split()[0])  # Count the number of #
+            text = line.lstrip('#').strip()
+            text = process_markdown_text(text, heading_styles[min(level, 3)])
+            style = heading_styles.get(min(level, 3))
+            story.append(Spacer(1, 8))
+            story.append(Paragraph(text, style))
+            story.append(Spacer(1, 4))
+            i += 1
+        # Handle alternate header style (=== or ---)
+        elif i + 1 < len(lines) and is_header_underline(lines[i + 1]):
+            # Add any pending paragraph
+            if current_paragraph:
+                text = ' '.join(current_paragraph)
+                text = process_markdown_text(text, normal_style)
+                story.append(Paragraph(text, normal_style))
+                current_paragraph = []
+
+            # Determine header level (=== is h1, --- is h2)
+            level = 1 if lines[i + 1].strip()[0] == '=' else 2
+            text = line.strip()
+            text = process_markdown_text(text, heading_styles[level])
+            style = heading_styles.get(level)
+            story.append(Spacer(1, 8))
+            story.append(Paragraph(text, style))
+            story.append(Spacer(1, 4))
+            i += 2  # Skip both the header text and the underline
+            continue
+
+        # Handle list items
+        elif line.lstrip().startswith(('+ ', '- ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ')):
+            # Add any pending paragraph
+            if current_paragraph:
+                text = ' '.join(current_paragraph)
+                text = process_markdown_text(text, normal_style)
+                story.append(Paragraph(text, normal_style))
+                current_paragraph = []
+
+            level, bullet, text = process_list_item(line)
+
+            # Create bullet style with proper indentation
+            current_bullet_style = ParagraphStyle(
+                f'Bullet{level}',
+                parent=bullet_style,
+                leftIndent=20 + (20 * level),
+                bulletIndent=10 + (20 * level)
+            )
+
+            text = process_markdown_text(text, current_bullet_style)
+            story.append(Paragraph(f'{bullet} {text}', current_bullet_style))
+            i += 1
+
+        # Handle normal paragraphs
+        else:
+            current_paragraph.append(line)
+            i += 1
+
+    # Add any remaining paragraph
+    if current_paragraph:
+        text = ' '.join(current_paragraph)
+        text = process_markdown_text(text, normal_style)
+        story.append(Paragraph(text, normal_style))
+
+    # Build the PDF
+    doc.build(story)
+
+    # Get the PDF content
+    pdf_content = pdf_buffer.getvalue()
+    pdf_buffer.close()
+    
+    return pdf_content
+
+def build_html(analysis, language):
+    """Render markdown analysis into a standalone HTML document."""
+    title = TITLES.get(language, TITLES['en'])
+    return (
+        f'<!DOCTYPE html>\n<html lang="{language}">\n<head>\n'
+        f'<meta charset="UTF-8">\n<title>{title}</title>\n</head>\n'
+        f'<body>\n<h1>{title}</h1>\n{render_analysis_html(analysis)}</body>\n</html>\n'
+    )
+
+def build_export_bundle(analyses):
+    """Package the Markdown, HTML and PDF exports of several analyses into one zip archive."""
+    bundle_buffer = io.BytesIO()
+    with zipfile.ZipFile(bundle_buffer, 'w', zipfile.ZIP_DEFLATED) as bundle:
+        for language, analysis in analyses.items():
+            base_name = f"{language}/{FILE_NAMES[language]}"
+            bundle.writestr(f"{base_name}.md", analysis)
+            bundle.writestr(f"{base_name}.html", build_html(analysis, language))
+            bundle.writestr(f"{base_name}.pdf", build_pdf(analysis, language))
+    bundle_buffer.seek(0)
+    return bundle_buffer
+
 @main.route('/')
 def index():
     return render_template('index.html')
 
-@main.route('/api/analyze', methods=['POST'])
+def fetch_analysis_data(github_service, owner, repo):
+    """Fetch everything the LLM needs for a repository in a single pass."""
+    repo_data = github_service.get_repo_metadata(owner, repo)
+    languages = github_service.get_languages(owner, repo)
+    readme_content = github_service.get_readme(owner, repo)
+    
+    # Get repository contents
+    contents = github_service.get_repo_contents(owner, repo)
+    
+    # Prepare data for analysis
+    analysis_data = {
+        'name': repo_data['name'],
+        'description': repo_data.get('description', ''),
+        'language': repo_data.get('language', ''),
+        'languages': list(languages.keys()),
+        'readme': readme_content or 'No README available',
+        'file_structure': '\n'.join([f"- {content.path}" for content in contents])
+    }
+    
+    repo_info = {
+        'name': repo_data['name'],
+        'description': repo_data.get('description', ''),
+        'languages': languages,
+        'stars': repo_data.get('stargazers_count', 0),
+        'forks': repo_data.get('forks_count', 0)
+    }
+    
+    return analysis_data, repo_info
+
+@main.route('/health')
+def health():
+    """Liveness probe: the worker is up and serving requests."""
+    return jsonify({'status': 'ok'})
+
+def get_readiness_services():
+    """Return the services used by the readiness probe, created once per process."""
+    services = current_app.extensions.get('readiness_services')
+    if services is None:
+        # Built once so frequent probes don't repeat the service start-up logging
+        services = (
+            GitHubService(current_app.config.get('GITHUB_TOKEN')),
+            LLMService(current_app.config.get('LLM_API_URL'))
+        )
+        current_app.extensions['readiness_services'] = services
+    return services
+
+@main.route('/ready')
+def ready():
+    """Readiness probe: the upstream GitHub and LLM APIs are reachable."""
+    timeout = current_app.config.get('READINESS_TIMEOUT', 3)
+    github_service, llm_service = get_readiness_services()
+
+    checks = {
+        'github': github_service.check_connection(timeout=timeout),
+        'llm': llm_service.check_connection(timeout=timeout)
+    }
+    is_ready = all(checks.values())
+    return jsonify({'status': 'ready' if is_ready else 'unavailable', 'checks': checks}), 200 if is_ready else 503
+
+def get_analysis_cache_key(owner, repo, language):
+    """Build the cache key for a single-language analysis."""
+    return ('analysis', owner.lower(), repo.lower(), language)
+
+def get_analyses(github_service, llm_service, owner, repo, languages):
+    """
+    Return analyses keyed by language, generating only the ones not cached yet.
+
+    Returns the analyses, the repository overview and the errors of the
+    languages whose generation failed, keyed by language.
+    """
+    cache = current_app.extensions['analysis_cache']
+    repo_info_key = get_repo_info_cache_key(owner, repo)
+    repo_info = cache.get(repo_info_key)
+    analyses = {}
+    missing = []
+    for lang in languages:
+        cached = cache.get(get_analysis_cache_key(owner, repo, lang))
+        if cached is not None:
+            analyses[lang] = cached
+        else:
+            missing.append(lang)
+
+    if not missing and repo_info is not None:
+        logger.info(f"Serving {owner}/{repo} analyses from cache")
+        return analyses, repo_info, {}
+
+    # Fetch GitHub data once, whatever the number of languages
+    analysis_data, repo_info = fetch_analysis_data(github_service, owner, repo)
+    cache.set(repo_info_key, repo_info)
+    if not missing:
+        return analyses, repo_info, {}
+
+    if len(missing) == 1:
+        try:
+            generated, errors = {missing[0]: llm_service.analyze_repo(analysis_data, missing[0])}, {}
+        except Exception as e:
+            generated, errors = {}, {missing[0]: e}
+    else:
+        generated, errors = llm_service.analyze_repo_languages(
+            analysis_data,
+            missing,
+            max_workers=current_app.config.get('ANALYSIS_MAX_WORKERS', 4)
+        )
+    # Cache every language that succeeded, even if others failed
+    for lang, analysis in generated.items():
+        cache.set(get_analysis_cache_key(owner, repo, lang), analysis)
+    if errors:
+        logger.error(f"Analysis failed for languages: {', '.join(errors)}")
+    analyses.update(generated)
+    return analyses, repo_info, errors
+
+def render_analysis_html(analysis):
+    """Convert analysis markdown to HTML, reusing the cached rendering when possible."""
+    cache = current_app.extensions['html_cache']
+    key = ('html', hashlib.sha256(analysis.encode('utf-8')).hexdigest())
+    analysis_html = cache.get(key)
+    if analysis_html is None:
+        analysis_html = markdown(analysis)
+        cache.set(key, analysis_html)
+    return analysis_html
+
+def serialize_analysis(analysis, fields):
+    """Build the analysis payload containing only the requested fields."""
+    payload = {}
+    if 'markdown' in fields:
+        payload['analysis'] = analysis
+    if 'html' in fields:
+        payload['analysis_html'] = render_analysis_html(analysis)
+    return payload
+
+def negotiate_encoding():
+    """Pick the best response encoding supported by both client and server."""
+    return request.accept_encodings.best_match(['br', 'gzip'] if brotli is not None else ['gzip'])
+
+def get_repo_info_cache_key(owner, repo):
+    """Build the cache key for a repository overview."""
+    return ('repo_info', owner.lower(), repo.lower())
+
+def get_analysis_etag(owner, repo, languages, multi, fields, encoding):
+    """
+    Build an ETag from the cache entries a response is made of.
+
+    The tag depends on the cache keys and their creation times rather than on
+    the generated text, so it can be checked before any fetch or generation.
+    Returns None if any of the entries is not cached.
+    """
+    cache = current_app.extensions['analysis_cache']
+    parts = ['multi' if multi else 'single', ','.join(sorted(fields)), encoding or 'identity']
+    keys = [get_repo_info_cache_key(owner, repo)] + [get_analysis_cache_key(owner, repo, lang) for lang in languages]
+    for key in keys:
+        entry = cache.get_entry(key)
+        if entry is None:
+            return None
+        parts.append(f"{key}@{entry[0]}")
+    digest = hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:32]
+    return f"{digest}-{encoding}" if encoding else digest
+
+def set_cache_headers(response, etag):
+    """Mark a response as revalidatable by browsers and CDNs."""
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('ANALYZE_CACHE_MAX_AGE', 300)
+    response.cache_control.must_revalidate = True
+    response.set_etag(etag)
+    return response
+
+def not_modified_response(etag):
+    """Answer a matching If-None-Match without building the body."""
+    return set_cache_headers(current_app.response_class(status=304), etag)
+
+def make_cacheable_response(payload, etag, encoding):
+    """Build a JSON response with ETag/Cache-Control, compressed by negotiation."""
+    response = jsonify(payload)
+    body = response.get_data()
+    if etag is None:
+        # Entries were evicted while building the response; fall back to the body
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        etag = f"{digest}-{encoding}" if encoding else digest
+    set_cache_headers(response, etag)
+
+    # Answers If-None-Match with an empty 304 for GET/HEAD revalidation
+    response.make_conditional(request)
+    if response.status_code != 200 or encoding is None or len(body) < current_app.config.get('COMPRESS_MIN_SIZE', 500):
+        return response
+
+    if encoding == 'br':
+        response.set_data(brotli.compress(body))
+    else:
+        response.set_data(gzip.compress(body, compresslevel=6, mtime=0))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def llm_error_response(errors):
+    """Report languages whose generation failed as an upstream LLM error."""
+    error_msg = "LLM API error: " + '; '.join(f"{lang}: {str(e)}" for lang, e in errors.items())
+    logger.error(error_msg)
+    return jsonify({'error': error_msg, 'errors': {lang: str(e) for lang, e in errors.items()}}), 502
+
+def get_analyze_params():
+    """Read analyze parameters from the JSON body (POST) or query string (GET/HEAD)."""
+    if request.method in ('GET', 'HEAD'):
+        args = request.args
+        languages = args.get('languages')
+        return {
+            'url': args.get('url'),
+            'language': args.get('language', 'en'),
+            'languages': languages.split(',') if languages else None,
+            'fields': args.get('fields')
+        }
+    return request.get_json()
+
+@main.route('/api/analyze', methods=['GET', 'POST'])
 def analyze_repo():
     try:
-        data = request.get_json()
+        data = get_analyze_params()
         github_url = data.get('url')
         language = data.get('language', 'en')
+        requested_languages = data.get('languages')
+        fields = data.get('fields') or ['markdown', 'html']
+        if isinstance(fields, str):
+            fields = fields.split(',')
 
         if not github_url:
             return jsonify({'error': 'GitHub URL is required'}), 400
 
-        github_service = GitHubService(current_app.config.get('GITHUB_TOKEN'))
+        if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+            return jsonify({'error': 'fields must be a list of strings'}), 400
+        if not set(fields) <= {'markdown', 'html'}:
+            return jsonify({'error': "fields may only contain 'markdown' and 'html'"}), 400
+
+        if not isinstance(language, str) or language not in LANGUAGE_PROMPTS:
+            return jsonify({'error': f"Unsupported language: {language}"}), 400
+
+        if requested_languages is not None:
+            if not isinstance(requested_languages, list) or not requested_languages:
+                return jsonify({'error': 'languages must be a non-empty list'}), 400
+            if not all(isinstance(lang, str) for lang in requested_languages):
+                return jsonify({'error': 'languages must be a list of strings'}), 400
+            unsupported = [lang for lang in requested_languages if lang not in LANGUAGE_PROMPTS]
+            if unsupported:
+                return jsonify({'error': f"Unsupported languages: {', '.join(map(str, unsupported))}"}), 400
+            # Preserve the requested order while dropping duplicates
+            requested_languages = list(dict.fromkeys(requested_languages))
+
+        github_service = GitHubService(
+            current_app.config.get('GITHUB_TOKEN'),
+            validate_contents=current_app.config.get('GITHUB_VALIDATE_CONTENTS', False)
+        )
         llm_service = LLMService(current_app.config.get('LLM_API_URL'))
 
         # Parse GitHub URL
@@ -205,40 +617,54 @@ def analyze_repo():
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
 
+        multi = requested_languages is not None
+        languages = requested_languages if multi else [language]
+        encoding = negotiate_encoding()
+
+        # Revalidation: answer from the cache keys alone, before any fetch or generation
+        if request.method in ('GET', 'HEAD') and request.if_none_match:
+            etag = get_analysis_etag(owner, repo, languages, multi, fields, encoding)
+            if etag is not None and request.if_none_match.contains(etag):
+                return not_modified_response(etag)
+
         try:
-            # Fetch repository data
-            repo_data = github_service.get_repo_metadata(owner, repo)
-            languages = github_service.get_languages(owner, repo)
-            readme_content = github_service.get_readme(owner, repo)
-            
-            # Get repository contents
-            contents = github_service.get_repo_contents(owner, repo)
-            
-            # Prepare data for analysis
-            analysis_data = {
-                'name': repo_data['name'],
-                'description': repo_data.get('description', ''),
-                'language': repo_data.get('language', ''),
-                'languages': list(languages.keys()),
-                'readme': readme_content or 'No README available',
-                'file_structure': '\n'.join([f"- {content.path}" for content in contents])
+            if not multi:
+                analyses, repo_info, errors = get_analyses(github_service, llm_service, owner, repo, [language])
+                if errors:
+                    return llm_error_response(errors)
+                
+                return make_cacheable_response({
+                    **serialize_analysis(analyses[language], fields),
+                    'language': language,
+                    'repo_data': repo_info
+                }, get_analysis_etag(owner, repo, languages, multi, fields, encoding), encoding)
+
+            # Multi-language mode
+            analyses, repo_info, errors = get_analyses(github_service, llm_service, owner, repo, requested_languages)
+            if not analyses:
+                return llm_error_response(errors)
+
+            payload = {
+                'analyses': {
+                    lang: serialize_analysis(analyses[lang], fields)
+                    for lang in requested_languages
+                    if lang in analyses
+                },
+                'languages': requested_languages,
+                'repo_data': repo_info
             }
+            if errors:
+                # Partial result: return what succeeded, but don't let it be cached
+                payload['errors'] = {lang: f"LLM API error: {str(e)}" for lang, e in errors.items()}
+                response = jsonify(payload)
+                response.cache_control.no_store = True
+                return response
 
-            # Generate analysis
-            analysis = llm_service.analyze_repo(analysis_data, language)
-            
-            return jsonify({
-                'analysis': analysis,
-                'analysis_html': markdown(analysis),
-                'language': language,
-                'repo_data': {
-                    'name': repo_data['name'],
-                    'description': repo_data.get('description', ''),
-                    'languages': languages,
-                    'stars': repo_data.get('stargazers_count', 0),
-                    'forks': repo_data.get('forks_count', 0)
-                }
-            })
+            return make_cacheable_response(
+                payload,
+                get_analysis_etag(owner, repo, languages, multi, fields, encoding),
+                encoding
+            )
 
         except RequestException as e:
             error_msg = f"GitHub API error: {str(e)}"
@@ -261,6 +687,26 @@ def export_analysis():
         format_type = data.get('format', 'markdown')
         analysis = data.get('analysis')
         language = data.get('language', 'en')
+        analyses = data.get('analyses')
+
+        # Multi-language export: {language: markdown} -> one zip with every format
+        if analyses is not None:
+            if not isinstance(analyses, dict) or not analyses:
+                return jsonify({'error': 'analyses must be a non-empty object'}), 400
+            unsupported = [lang for lang in analyses if lang not in FILE_NAMES]
+            if unsupported:
+                return jsonify({'error': f"Unsupported languages: {', '.join(unsupported)}"}), 400
+            if not all(isinstance(analysis, str) for analysis in analyses.values()):
+                return jsonify({'error': 'analyses values must be markdown strings'}), 400
+            if not all(analyses.values()):
+                return jsonify({'error': 'Analysis content is required'}), 400
+
+            return send_file(
+                build_export_bundle(analyses),
+                mimetype='application/zip',
+                as_attachment=True,
+                download_name=f"{FILE_NAMES['en']}.zip"
+            )
 
         if not analysis:
             return jsonify({'error': 'Analysis content is required'}), 400
@@ -272,147 +718,7 @@ def export_analysis():
                 'filename': f"{FILE_NAMES[language]}.md"
             })
         elif format_type == 'pdf':
-            # Create a PDF in memory
-            pdf_buffer = io.BytesIO()
-            
-            # Create the PDF document with A4 size and margins
-            doc = SimpleDocTemplate(
-                pdf_buffer,
-                pagesize=letter,
-                rightMargin=54,  # Adjusted margins
-                leftMargin=54,
-                topMargin=54,
-                bottomMargin=54,
-                title=TITLES.get(language, TITLES['en'])  # Add PDF title metadata
-            )
-            
-            # Get styles with appropriate font
-            title_style, normal_style, heading_styles, bullet_style, code_style = create_pdf_style(language)
-            
-            # Convert markdown to a format ReportLab can handle
-            story = []
-            
-            # Add title in the correct language
-            title_text = process_markdown_text(TITLES.get(language, TITLES['en']), title_style)
-            story.append(Paragraph(title_text, title_style))
-            story.append(Spacer(1, 24))  # More space after title
-            
-            # Process the content line by line
-            lines = analysis.split('\n')
-            in_code_block = False
-            code_content = []
-            current_paragraph = []
-            
-            i = 0
-            while i < len(lines):
-                line = lines[i].rstrip()
-                
-                # Skip empty lines but add paragraph if we have content
-                if not line:
-                    if current_paragraph:
-                        text = ' '.join(current_paragraph)
-                        text = process_markdown_text(text, normal_style)
-                        story.append(Paragraph(text, normal_style))
-                        story.append(Spacer(1, 4))
-                        current_paragraph = []
-                    i += 1
-                    continue
-                
-                # Handle code blocks
-                if line.startswith('```') or line.endswith('```'):
-                    if line.startswith('```'):
-                        in_code_block = True
-                        code_content = []
-                    else:
-                        in_code_block = False
-                        if code_content:
-                            story.append(Paragraph('\n'.join(code_content), code_style))
-                        code_content = []
-                    i += 1
-                    continue
-                
-                if in_code_block:
-                    code_content.append(line)
-                    i += 1
-                    continue
-                
-                # Handle headers
-                if line.startswith('#'):
-                    # Add any pending paragraph
-                    if current_paragraph:
-                        text = ' '.join(current_paragraph)
-                        text = process_markdown_text(text, normal_style)
-                        story.append(Paragraph(text, normal_style))
-                        current_paragraph = []
-                    
-                    level = len(line.split()[0])  # Count the number of #
-                    text = line.lstrip('#').strip()
-                    text = process_markdown_text(text, heading_styles[min(level, 3)])
-                    style = heading_styles.get(min(level, 3))
-                    story.append(Spacer(1, 8))
-                    story.append(Paragraph(text, style))
-                    story.append(Spacer(1, 4))
-                    i += 1
-                # Handle alternate header style (=== or ---)
-                elif i + 1 < len(lines) and is_header_underline(lines[i + 1]):
-                    # Add any pending paragraph
-                    if current_paragraph:
-                        text = ' '.join(current_paragraph)
-                        text = process_markdown_text(text, normal_style)
-                        story.append(Paragraph(text, normal_style))
-                        current_paragraph = []
-                    
-                    # Determine header level (=== is h1, --- is h2)
-                    level = 1 if lines[i + 1].strip()[0] == '=' else 2
-                    text = line.strip()
-                    text = process_markdown_text(text, heading_styles[level])
-                    style = heading_styles.get(level)
-                    story.append(Spacer(1, 8))
-                    story.append(Paragraph(text, style))
-                    story.append(Spacer(1, 4))
-                    i += 2  # Skip both the header text and the underline
-                    continue
-                
-                # Handle list items
-                elif line.lstrip().startswith(('+ ', '- ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ')):
-                    # Add any pending paragraph
-                    if current_paragraph:
-                        text = ' '.join(current_paragraph)
-                        text = process_markdown_text(text, normal_style)
-                        story.append(Paragraph(text, normal_style))
-                        current_paragraph = []
-                    
-                    level, bullet, text = process_list_item(line)
-                    
-                    # Create bullet style with proper indentation
-                    current_bullet_style = ParagraphStyle(
-                        f'Bullet{level}',
-                        parent=bullet_style,
-                        leftIndent=20 + (20 * level),
-                        bulletIndent=10 + (20 * level)
-                    )
-                    
-                    text = process_markdown_text(text, current_bullet_style)
-                    story.append(Paragraph(f'{bullet} {text}', current_bullet_style))
-                    i += 1
-                
-                # Handle normal paragraphs
-                else:
-                    current_paragraph.append(line)
-                    i += 1
-            
-            # Add any remaining paragraph
-            if current_paragraph:
-                text = ' '.join(current_paragraph)
-                text = process_markdown_text(text, normal_style)
-                story.append(Paragraph(text, normal_style))
-            
-            # Build the PDF
-            doc.build(story)
-            
-            # Get the PDF content
-            pdf_content = pdf_buffer.getvalue()
-            pdf_buffer.close()
+            pdf_content = build_pdf(analysis, language)
             
             # Create a new BytesIO object for sending the file
             response_buffer = io.BytesIO(pdf_content)
@@ -0,0 +1,43 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AnalysisCache:
+    """Small thread-safe in-process cache with a per-entry time-to-live."""
+
+    def __init__(self, ttl: int = 3600, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[1] if entry is not None else None
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Return (creation timestamp, value) for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, created_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return created_at, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + self.ttl, time.time(), value)
+        logger.debug(f"Cached entry for {key}")
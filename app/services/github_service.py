@@ -1,9 +1,10 @@
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 from pydantic import BaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import logging
 import base64
+import json
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +15,39 @@ class RepoContent(BaseModel):
     content: Optional[str] = None
     size: int
 
+class RepoEntry(NamedTuple):
+    """Lightweight, tuple-backed listing entry used for bulk directory listings."""
+    name: str
+    path: str
+    type: str
+    size: int
+
+_ENTRY_FIELDS = frozenset(RepoEntry._fields)
+
+def _repo_entry_hook(pairs: List[Tuple[str, object]]) -> Optional[RepoEntry]:
+    """Turn each decoded listing object straight into a RepoEntry, dropping unused fields."""
+    fields = {key: value for key, value in pairs if key in _ENTRY_FIELDS}
+    if 'path' not in fields:
+        # Nested objects such as '_links' are not needed
+        return None
+    return RepoEntry(fields.get('name', ''), fields['path'], fields.get('type', ''), fields.get('size', 0))
+
+def parse_repo_contents(raw: bytes) -> List[RepoEntry]:
+    """Decode a contents listing, keeping no per-entry dict or model, only RepoEntry tuples."""
+    contents = json.loads(raw, object_pairs_hook=_repo_entry_hook)
+    if not isinstance(contents, list):
+        contents = [contents]
+    return [entry for entry in contents if entry is not None]
+
+def validate_repo_contents(raw: bytes) -> List[RepoContent]:
+    """Decode a contents listing into fully validated RepoContent models."""
+    contents = json.loads(raw)
+    if not isinstance(contents, list):
+        contents = [contents]
+    return [RepoContent(**item) for item in contents]
+
 class GitHubService:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, validate_contents: bool = False):
         self.token = token.strip().strip('"') if token else None  # Remove quotes and whitespace
         if not self.token:
             logger.warning("No GitHub token provided. API rate limits will be restricted.")
@@ -26,6 +58,8 @@ class GitHubService:
         }
         logger.info(f"Initializing GitHub service with token: {'Present' if self.token else 'Not present'}")
         self.base_url = 'https://api.github.com'
+        # Pydantic validation of listings is opt-in, mainly for debugging API changes
+        self.validate_contents = validate_contents
 
     @retry(
         stop=stop_after_attempt(3),
@@ -50,17 +84,16 @@ class GitHubService:
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type(requests.exceptions.RequestException)
     )
-    def get_repo_contents(self, owner: str, repo: str, path: str = '') -> List[RepoContent]:
+    def get_repo_contents(self, owner: str, repo: str, path: str = '') -> List[Union[RepoEntry, RepoContent]]:
         """Fetch repository contents."""
         url = f'{self.base_url}/repos/{owner}/{repo}/contents/{path}'
         logger.info(f"Fetching repo contents from: {url}")
         try:
             response = requests.get(url, headers=self.headers)
             response.raise_for_status()
-            contents = response.json()
-            if not isinstance(contents, list):
-                contents = [contents]
-            return [RepoContent(**item) for item in contents]
+            if self.validate_contents:
+                return validate_repo_contents(response.content)
+            return parse_repo_contents(response.content)
         except requests.exceptions.HTTPError as e:
             logger.error(f"GitHub API error: {e.response.status_code} - {e.response.text}")
             raise
@@ -107,6 +140,16 @@ class GitHubService:
                 logger.error(f"Response status: {e.response.status_code} - {e.response.text}")
             raise
 
+    def check_connection(self, timeout: float = 3) -> bool:
+        """Check that the GitHub API is reachable without using rate-limited quota."""
+        try:
+            response = requests.get(f'{self.base_url}/rate_limit', headers=self.headers, timeout=timeout)
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"GitHub API readiness check failed: {str(e)}")
+            return False
+
     def parse_github_url(self, url: str) -> tuple[str, str]:
         """Parse GitHub URL into owner and repo."""
         parts = url.rstrip('/').split('/')
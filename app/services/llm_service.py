@@ -1,6 +1,7 @@
 import requests
-from typing import Dict
+from typing import Dict, List, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,16 @@ class LLMService:
             'Content-Type': 'application/json'
         }
 
+    def check_connection(self, timeout: float = 3) -> bool:
+        """Check that the LLM API is reachable and serving models."""
+        try:
+            response = requests.get(f"{self.api_url}/v1/models", headers=self.headers, timeout=timeout)
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"LLM API readiness check failed: {str(e)}")
+            return False
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -86,3 +97,35 @@ Format the response in Markdown."""
             if hasattr(e, 'response'):
                 logger.error(f"Response status: {e.response.status_code} - {e.response.text}")
             raise
+
+    def analyze_repo_languages(self, repo_data: Dict, languages: List[str], max_workers: int = 4) -> Tuple[Dict[str, str], Dict[str, Exception]]:
+        """
+        Analyze the same repository data in several languages concurrently.
+        
+        Args:
+            repo_data: Dictionary containing repository information
+            languages: Target languages for the analysis
+            max_workers: Maximum number of concurrent LLM requests
+        
+        Returns:
+            Tuple[Dict[str, str], Dict[str, Exception]]: Generated analyses and
+            the errors of the languages that failed, both keyed by language
+        """
+        if not languages:
+            return {}, {}
+
+        logger.info(f"Generating analysis in {len(languages)} languages: {', '.join(languages)}")
+        analyses = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(languages)))) as executor:
+            futures = {
+                language: executor.submit(self.analyze_repo, repo_data, language)
+                for language in languages
+            }
+            for language, future in futures.items():
+                try:
+                    analyses[language] = future.result()
+                except Exception as e:
+                    logger.error(f"Analysis in {language} failed: {str(e)}")
+                    errors[language] = e
+        return analyses, errors
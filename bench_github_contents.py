@@ -0,0 +1,61 @@
+from app.services.github_service import parse_repo_contents, validate_repo_contents
+import json
+import time
+import tracemalloc
+
+ENTRY_COUNT = 5000
+ROUNDS = 20
+
+def build_listing(count):
+    """Build a synthetic contents listing shaped like the GitHub API response."""
+    base = 'https://api.github.com/repos/owner/repo'
+    return json.dumps([
+        {
+            'name': f'file_{i}.py',
+            'path': f'src/module/file_{i}.py',
+            'sha': 'a' * 40,
+            'size': i,
+            'url': f'{base}/contents/src/module/file_{i}.py?ref=main',
+            'html_url': f'https://github.com/owner/repo/blob/main/src/module/file_{i}.py',
+            'git_url': f'{base}/git/blobs/{"a" * 40}',
+            'download_url': f'https://raw.githubusercontent.com/owner/repo/main/src/module/file_{i}.py',
+            'type': 'file',
+            '_links': {
+                'self': f'{base}/contents/src/module/file_{i}.py?ref=main',
+                'git': f'{base}/git/blobs/{"a" * 40}',
+                'html': f'https://github.com/owner/repo/blob/main/src/module/file_{i}.py'
+            }
+        }
+        for i in range(count)
+    ]).encode('utf-8')
+
+def measure(parser, raw):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        parser(raw)
+    elapsed_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+    tracemalloc.start()
+    entries = parser(raw)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024, retained / 1024, len(entries)
+
+def run_benchmark():
+    raw = build_listing(ENTRY_COUNT)
+    print(f"Listing: {ENTRY_COUNT} entries, {len(raw) / 1024:.0f} KiB of JSON\n")
+    print(f"{'parser':<12}{'time (ms)':>12}{'peak (KiB)':>14}{'retained (KiB)':>18}")
+
+    results = {}
+    for label, parser in (('pydantic', validate_repo_contents), ('lean', parse_repo_contents)):
+        elapsed_ms, peak, retained, count = measure(parser, raw)
+        assert count == ENTRY_COUNT
+        results[label] = (elapsed_ms, peak)
+        print(f"{label:<12}{elapsed_ms:>12.2f}{peak:>14.0f}{retained:>18.0f}")
+
+    time_ratio = results['pydantic'][0] / results['lean'][0]
+    peak_ratio = results['pydantic'][1] / results['lean'][1]
+    print(f"\nLean parsing is {time_ratio:.1f}x faster with {peak_ratio:.1f}x lower peak allocation")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,65 @@
+import os
+import shlex
+import sys
+from dotenv import load_dotenv
+
+# Load .env before reading any server setting, as app.config does
+load_dotenv()
+
+def _resolve_worker_class():
+    """Return the worker class from the command line or GUNICORN_CMD_ARGS, else SERVER_WORKER_CLASS."""
+    args = shlex.split(os.getenv('GUNICORN_CMD_ARGS', '')) + sys.argv[1:]
+    resolved = None
+    for i, arg in enumerate(args):
+        if arg in ('-k', '--worker-class') and i + 1 < len(args):
+            resolved = args[i + 1]
+        elif arg.startswith('--worker-class='):
+            resolved = arg.split('=', 1)[1]
+        elif arg.startswith('-k') and len(arg) > 2:
+            resolved = arg[2:]
+    return resolved or os.getenv('SERVER_WORKER_CLASS', 'gthread')
+
+# The worker class is resolved here, not in Config: importing the app package
+# pulls in requests/urllib3/ssl, and with preload_app the master does that
+# import, so gevent must monkey-patch first or HTTPS calls break
+worker_class = _resolve_worker_class()
+if 'gevent' in worker_class.lower():
+    from gevent import monkey
+    monkey.patch_all()
+
+from app.config import Config
+import logging
+
+logger = logging.getLogger('gunicorn.conf')
+
+# Server socket
+bind = Config.SERVER_BIND
+keepalive = Config.SERVER_KEEPALIVE
+
+# Worker processes
+workers = Config.SERVER_WORKERS
+threads = Config.SERVER_THREADS
+# Recycle workers periodically; jitter keeps them from restarting all at once
+max_requests = Config.SERVER_MAX_REQUESTS
+max_requests_jitter = Config.SERVER_MAX_REQUESTS_JITTER
+timeout = Config.SERVER_TIMEOUT
+
+# Load the app in the master so forked workers share its memory copy-on-write
+preload_app = True
+
+# On SIGTERM workers stop accepting connections and finish in-flight requests
+graceful_timeout = Config.SERVER_GRACEFUL_TIMEOUT
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = Config.LOG_LEVEL.lower()
+
+def on_starting(server):
+    logger.info(
+        f"Starting {workers} {worker_class} workers"
+        f"{f' with {threads} threads' if worker_class == 'gthread' else ''} on {bind}"
+    )
+
+def worker_exit(server, worker):
+    logger.info(f"Worker {worker.pid} exited")
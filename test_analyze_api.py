@@ -0,0 +1,218 @@
+from app import create_app
+from app.services.llm_service import LLMService
+from unittest import mock
+import gzip
+import io
+import json
+import zipfile
+import markdown2
+import pytest
+
+ANALYSIS = '# Overview\n\n' + 'This repository does **useful** things.\n\n' * 40
+REPO_URL = 'https://github.com/owner/repo'
+
+@pytest.fixture
+def services():
+    """Patch the GitHub and LLM services so no request leaves the process."""
+    with mock.patch('app.routes.GitHubService') as github_cls, mock.patch('app.routes.LLMService') as llm_cls:
+        github = github_cls.return_value
+        github.parse_github_url.return_value = ('owner', 'repo')
+        github.get_repo_metadata.return_value = {'name': 'repo', 'description': 'A repo', 'language': 'Python'}
+        github.get_languages.return_value = {'Python': 1000}
+        github.get_readme.return_value = 'README'
+        github.get_repo_contents.return_value = []
+        llm = llm_cls.return_value
+        llm.analyze_repo.return_value = ANALYSIS
+        llm.analyze_repo_languages.side_effect = lambda data, languages, max_workers=4: (
+            {lang: f'# {lang}\n\n{ANALYSIS}' for lang in languages}, {}
+        )
+        yield github, llm
+
+@pytest.fixture
+def client(services):
+    return create_app().test_client()
+
+def test_matching_etag_returns_not_modified(client, services):
+    first = client.get('/api/analyze', query_string={'url': REPO_URL})
+    assert first.status_code == 200
+    assert first.headers['ETag']
+    assert 'max-age' in first.headers['Cache-Control']
+
+    second = client.get(
+        '/api/analyze',
+        query_string={'url': REPO_URL},
+        headers={'If-None-Match': first.headers['ETag']}
+    )
+    assert second.status_code == 304
+    assert second.data == b''
+    # The second request was answered from the analysis cache
+    assert services[1].analyze_repo.call_count == 1
+
+def test_head_request_supports_revalidation(client, services):
+    first = client.head('/api/analyze', query_string={'url': REPO_URL})
+    assert first.status_code == 200
+    assert first.data == b''
+    assert first.headers['ETag']
+
+    second = client.head(
+        '/api/analyze',
+        query_string={'url': REPO_URL},
+        headers={'If-None-Match': first.headers['ETag']}
+    )
+    assert second.status_code == 304
+
+def test_matching_etag_skips_fetch_and_generation(client):
+    etag = client.get('/api/analyze', query_string={'url': REPO_URL, 'fields': 'html'}).headers['ETag']
+
+    with mock.patch('app.routes.get_analyses') as get_analyses:
+        response = client.get(
+            '/api/analyze',
+            query_string={'url': REPO_URL, 'fields': 'html'},
+            headers={'If-None-Match': etag}
+        )
+    assert response.status_code == 304
+    assert response.headers['ETag'].strip('"') == etag.strip('"')
+    get_analyses.assert_not_called()
+
+    # A different representation of the same analysis has its own tag
+    other = client.get('/api/analyze', query_string={'url': REPO_URL}, headers={'If-None-Match': etag})
+    assert other.status_code == 200
+
+def test_gzip_body_decompresses_to_same_json(client):
+    plain = client.get('/api/analyze', query_string={'url': REPO_URL})
+    compressed = client.get('/api/analyze', query_string={'url': REPO_URL}, headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert compressed.headers['ETag'] != plain.headers['ETag']
+
+def test_encoding_follows_client_quality(client):
+    response = client.get(
+        '/api/analyze',
+        query_string={'url': REPO_URL},
+        headers={'Accept-Encoding': 'gzip;q=1, br;q=0.1'}
+    )
+    assert response.headers['Content-Encoding'] == 'gzip'
+
+def test_fields_html_omits_markdown(client):
+    response = client.get('/api/analyze', query_string={'url': REPO_URL, 'fields': 'html'})
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert 'analysis' not in data
+    assert data['analysis_html'].startswith('<h1>Overview</h1>')
+
+def test_invalid_fields_type_is_rejected(client):
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'fields': 3})
+    assert response.status_code == 400
+
+def test_html_rendering_is_cached(client):
+    with mock.patch('app.routes.markdown', wraps=markdown2.markdown) as render:
+        client.post('/api/analyze', json={'url': REPO_URL})
+        client.post('/api/analyze', json={'url': REPO_URL, 'fields': ['html']})
+    assert render.call_count == 1
+
+def test_health_and_readiness_probes(client, services):
+    services[0].check_connection.return_value = True
+    services[1].check_connection.return_value = False
+
+    assert client.get('/health').status_code == 200
+    ready = client.get('/ready')
+    assert ready.status_code == 503
+    assert ready.get_json()['checks'] == {'github': True, 'llm': False}
+
+def test_languages_fetch_github_data_once(client, services):
+    github, llm = services
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'languages': ['en', 'es', 'fr']})
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert list(data['analyses']) == ['en', 'es', 'fr']
+    assert data['analyses']['es']['analysis'].startswith('# es')
+    assert github.get_repo_metadata.call_count == 1
+    assert github.get_repo_contents.call_count == 1
+    llm.analyze_repo_languages.assert_called_once()
+    assert llm.analyze_repo_languages.call_args[0][1] == ['en', 'es', 'fr']
+
+def test_cached_language_is_not_regenerated(client, services):
+    github, llm = services
+    client.post('/api/analyze', json={'url': REPO_URL, 'language': 'en'})
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'languages': ['en', 'es', 'fr']})
+
+    assert response.get_json()['analyses']['en']['analysis'] == ANALYSIS
+    assert llm.analyze_repo.call_count == 1
+    assert llm.analyze_repo_languages.call_args[0][1] == ['es', 'fr']
+
+    # Everything is cached now: no GitHub fetch and no generation
+    client.post('/api/analyze', json={'url': REPO_URL, 'languages': ['fr', 'en']})
+    assert github.get_repo_metadata.call_count == 2
+    assert llm.analyze_repo_languages.call_count == 1
+
+def test_evicted_repo_info_keeps_cached_analyses(client, services):
+    github, llm = services
+    client.post('/api/analyze', json={'url': REPO_URL, 'language': 'en'})
+    client.application.extensions['analysis_cache']._entries.pop(('repo_info', 'owner', 'repo'))
+
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'language': 'en'})
+
+    assert response.status_code == 200
+    assert github.get_repo_metadata.call_count == 2
+    assert llm.analyze_repo.call_count == 1
+
+def test_partial_failure_returns_successful_languages(client, services):
+    services[1].analyze_repo_languages.side_effect = lambda data, languages, max_workers=4: (
+        {'en': ANALYSIS}, {'es': RuntimeError('boom')}
+    )
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'languages': ['en', 'es']})
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert list(data['analyses']) == ['en']
+    assert data['errors'] == {'es': 'LLM API error: boom'}
+    assert response.cache_control.no_store
+
+def test_single_language_failure_is_reported_as_llm_error(client, services):
+    services[1].analyze_repo.side_effect = RuntimeError('timeout')
+    response = client.post('/api/analyze', json={'url': REPO_URL, 'language': 'de'})
+
+    assert response.status_code == 502
+    assert response.get_json()['error'].startswith('LLM API error')
+
+def test_analyze_repo_languages_keeps_successes():
+    def analyze(repo_data, language):
+        if language == 'es':
+            raise RuntimeError('boom')
+        return f'# {language}'
+
+    llm_service = LLMService('http://llm')
+    with mock.patch.object(llm_service, 'analyze_repo', side_effect=analyze):
+        analyses, errors = llm_service.analyze_repo_languages({}, ['en', 'es', 'fr'])
+
+    assert analyses == {'en': '# en', 'fr': '# fr'}
+    assert list(errors) == ['es']
+
+@pytest.mark.parametrize('payload', [
+    {'language': ['en']},
+    {'language': 'xx'},
+    {'languages': [['en']]},
+    {'languages': ['en', 'xx']}
+])
+def test_invalid_languages_are_rejected(client, payload):
+    response = client.post('/api/analyze', json={'url': REPO_URL, **payload})
+    assert response.status_code == 400
+
+def test_export_bundle_contains_every_format(client):
+    response = client.post('/api/export', json={'analyses': {'en': ANALYSIS, 'zh': '# 概述\n\n内容'}})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/zip'
+    names = set(zipfile.ZipFile(io.BytesIO(response.data)).namelist())
+    for lang, base_name in (('en', 'repository_analysis'), ('zh', '代码仓库分析')):
+        for extension in ('md', 'html', 'pdf'):
+            assert f'{lang}/{base_name}.{extension}' in names
+
+def test_export_bundle_rejects_non_string_analysis(client):
+    response = client.post('/api/export', json={'analyses': {'en': 123}})
+    assert response.status_code == 400
@@ -0,0 +1,48 @@
+from app.services.github_service import RepoEntry, parse_repo_contents, validate_repo_contents
+import json
+
+BASE_URL = 'https://api.github.com/repos/owner/repo'
+
+def make_entry(path, entry_type='file', size=100):
+    """Build a contents entry shaped like the GitHub API response."""
+    return {
+        'name': path.rsplit('/', 1)[-1],
+        'path': path,
+        'sha': 'a' * 40,
+        'size': size,
+        'url': f'{BASE_URL}/contents/{path}?ref=main',
+        'html_url': f'https://github.com/owner/repo/blob/main/{path}',
+        'git_url': f'{BASE_URL}/git/blobs/{"a" * 40}',
+        'download_url': f'https://raw.githubusercontent.com/owner/repo/main/{path}' if entry_type == 'file' else None,
+        'type': entry_type,
+        '_links': {
+            'self': f'{BASE_URL}/contents/{path}?ref=main',
+            'git': f'{BASE_URL}/git/blobs/{"a" * 40}',
+            'html': f'https://github.com/owner/repo/blob/main/{path}'
+        }
+    }
+
+def test_listing_matches_validated_parse():
+    listing = [make_entry('README.md'), make_entry('app', 'dir', 0), make_entry('run.py', size=7)]
+    raw = json.dumps(listing).encode('utf-8')
+
+    entries = parse_repo_contents(raw)
+    validated = validate_repo_contents(raw)
+
+    assert [entry.path for entry in entries] == [content.path for content in validated]
+    assert entries[1] == RepoEntry('app', 'app', 'dir', 0)
+
+def test_single_file_response():
+    single = make_entry('app/config.py', size=42)
+    single.update({'content': 'cHJpbnQoKQ==', 'encoding': 'base64'})
+    raw = json.dumps(single).encode('utf-8')
+
+    entries = parse_repo_contents(raw)
+
+    assert entries == [RepoEntry('config.py', 'app/config.py', 'file', 42)]
+    assert [entry.path for entry in entries] == [content.path for content in validate_repo_contents(raw)]
+
+def test_entry_with_few_fields_is_kept():
+    raw = json.dumps([{'name': 'a', 'path': 'a', 'type': 'file'}]).encode('utf-8')
+
+    assert parse_repo_contents(raw) == [RepoEntry('a', 'a', 'file', 0)]